@@ -6,7 +6,7 @@ import sys
 
 # Add parent directory to path to access generator
 sys.path.insert(0, str(Path(__file__).parent))
-from generator import save_project, list_projects, load_project, delete_project, update_project, git_push
+from generator import save_project, list_projects, load_project, delete_project, update_project, patch_project, git_push
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB max
@@ -119,6 +119,39 @@ def update_project_route(slug):
         return jsonify({'success': False, 'error': f'Server error: {str(e)}'}), 500
 
 
+@app.route('/project/<slug>', methods=['PATCH'])
+def patch_project_route(slug):
+    """Apply field-level changes to existing project."""
+    try:
+        changes = request.get_json(silent=True)
+        if not isinstance(changes, dict):
+            return jsonify({'success': False, 'error': 'Expected a JSON object of changes'}), 400
+        
+        # Patch only the affected lines/sections
+        result = patch_project(slug, changes, PROJECT_ROOT)
+        
+        # Commit and push only the Markdown file (images are untouched)
+        git_result = None
+        if result['changed']:
+            git_result = git_push(
+                PROJECT_ROOT,
+                f'Update project: {slug} ({", ".join(result["fields"])})',
+                paths=[result['markdown_file']]
+            )
+        
+        return jsonify({
+            'success': True,
+            'message': f'Project patched: {slug}' if result['changed'] else 'No changes',
+            'fields': result['fields'],
+            'git': git_result
+        })
+        
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'success': False, 'error': f'Server error: {str(e)}'}), 500
+
+
 @app.route('/generate', methods=['POST'])
 def generate():
     """Generate project files from form data."""
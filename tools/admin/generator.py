@@ -407,25 +407,251 @@ def update_project(data, images, old_slug, project_root, keep_existing_images=No
     }
 
 
-def git_push(project_root, message):
+PATCHABLE_FRONT_MATTER = ['title', 'description', 'category', 'date', 'tools']
+PATCHABLE_SECTIONS = {'overview': 'Overview', 'takeaways': 'Key Takeaways'}
+
+
+def format_front_matter_line(key, value):
+    """Format a single front matter line the same way generate_front_matter does."""
+    if key == 'tools':
+        tools_str = ', '.join([f'"{t}"' for t in value])
+        return f'tools: [{tools_str}]'
+    if key == 'date':
+        return f'date: {value}'
+    return f'{key}: "{value}"'
+
+
+def replace_front_matter_key(content, key, value):
+    """Replace one key line inside the front matter block."""
+    parts = content.split('---', 2)
+    if not content.startswith('---') or len(parts) < 3:
+        raise ValueError("Invalid project file format")
+
+    pattern = re.compile(rf'^{key}:.*$', re.MULTILINE)
+    if not pattern.search(parts[1]):
+        raise ValueError(f"Front matter key '{key}' not found")
+
+    line = format_front_matter_line(key, value)
+    front_matter = pattern.sub(lambda _: line, parts[1], count=1)
+    return '---'.join([parts[0], front_matter, parts[2]])
+
+
+def replace_section(content, heading, new_body):
+    """Replace the body of a `## heading` section, keeping surrounding whitespace."""
+    match = re.search(rf'^## {re.escape(heading)}[ \t]*\n(.*?)(?=^## |\Z)', content, re.MULTILINE | re.DOTALL)
+    if not match:
+        raise ValueError(f"Section '{heading}' not found")
+
+    section = match.group(1)
+    stripped = section.strip()
+    if stripped:
+        start = match.start(1) + section.index(stripped)
+        end = start + len(stripped)
+    else:
+        start = end = match.start(1)
+    return content[:start] + new_body + content[end:]
+
+
+def replace_visual(content, slug, index, caption=None, role=None):
+    """Replace caption and/or role of the visual-{index}.png figure."""
+    filename = f'visual-{index}.png'
+    figure_pattern = re.compile(
+        r'<figure class="project-visual">\s*<img src="[^"]*/' + re.escape(filename) + r'"[^>]*>.*?</figure>',
+        re.DOTALL
+    )
+    match = figure_pattern.search(content)
+    if not match:
+        raise ValueError(f"Visual {index} not found")
+
+    figure = match.group(0)
+    current = re.search(r'<figcaption>(?:<strong>)?([^:<]+):(?:</strong>)?\s*([^<]*)</figcaption>', figure)
+    role = role or (current.group(1).strip() if current else 'Result')
+    caption = caption or (current.group(2).strip() if current else '')
+
+    new_figure = f'''<figure class="project-visual">
+  <img src="/assets/images/projects/{slug}/{filename}" alt="{caption}">
+  <figcaption><strong>{role}:</strong> {caption}</figcaption>
+</figure>'''
+    return content[:match.start()] + new_figure + content[match.end():]
+
+
+def validate_patch_changes(changes):
+    """Validate and normalize PATCH changes before any splicing.
+
+    tools and takeaways may be lists of strings or, like the PUT form,
+    comma- and newline-separated strings.
+
+    Returns:
+        dict with stripped values and visuals keyed by int index
+    """
+    if not isinstance(changes, dict):
+        raise ValueError("Changes must be an object")
+    if not changes:
+        raise ValueError("No changes provided")
+
+    allowed = PATCHABLE_FRONT_MATTER + list(PATCHABLE_SECTIONS) + ['visuals']
+    unknown = [key for key in changes if key not in allowed]
+    if unknown:
+        raise ValueError(f"Unsupported fields: {', '.join(unknown)}")
+
+    clean = {}
+    for key in ['title', 'description', 'category', 'date', 'overview']:
+        if key not in changes:
+            continue
+        value = changes[key]
+        if not isinstance(value, str):
+            raise ValueError(f"Field '{key}' must be a string")
+        value = value.strip()
+        if not value:
+            raise ValueError(f"Missing required fields: {key}")
+        if key != 'overview' and '\n' in value:
+            raise ValueError(f"Field '{key}' must be a single line")
+        clean[key] = value
+
+    if 'date' in clean:
+        try:
+            datetime.strptime(clean['date'], '%Y-%m-%d')
+        except ValueError:
+            raise ValueError("Date must be YYYY-MM-DD format")
+
+    # load_project ends a section at the next '##', so it must not appear in section text
+    if 'overview' in clean and '##' in clean['overview']:
+        raise ValueError("Overview cannot contain '##' (it would start a new section)")
+
+    for key, separator in [('tools', ','), ('takeaways', '\n')]:
+        if key not in changes:
+            continue
+        value = changes[key]
+        if isinstance(value, str):
+            value = value.split(separator)
+        if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+            raise ValueError(f"Field '{key}' must be a list of strings")
+        items = [item.strip() for item in value if item.strip()]
+        if key == 'tools' and any('\n' in item for item in items):
+            raise ValueError("Tools must be single-line strings")
+        if key == 'takeaways':
+            if not items:
+                raise ValueError("Missing required fields: takeaways")
+            if any('##' in item for item in items):
+                raise ValueError("Takeaways cannot contain '##'")
+        clean[key] = items
+
+    if 'visuals' in changes:
+        visuals = changes['visuals']
+        if not isinstance(visuals, dict) or not visuals:
+            raise ValueError("Visuals must be an object of {index: {caption, role}}")
+        clean['visuals'] = {}
+        for index, visual in visuals.items():
+            try:
+                index = int(index)
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid visual index: {index}")
+            # Hero caption is not stored in the Markdown file
+            if index < 1:
+                raise ValueError("Hero visual has no editable caption")
+            if not isinstance(visual, dict):
+                raise ValueError(f"Visual {index} must be an object with caption and/or role")
+            fields = {}
+            for field in ['caption', 'role']:
+                value = visual.get(field)
+                if value is None:
+                    continue
+                if not isinstance(value, str):
+                    raise ValueError(f"Visual {index} {field} must be a string")
+                value = value.strip()
+                if '\n' in value or '##' in value:
+                    raise ValueError(f"Visual {index} {field} must be a single line without '##'")
+                if value:
+                    fields[field] = value
+            if not fields:
+                raise ValueError(f"Visual {index} needs a caption or role")
+            clean['visuals'][index] = fields
+
+    return clean
+
+
+def patch_project(slug, changes, project_root):
+    """Apply field-level changes to an existing project in place.
+
+    Only the touched front matter lines and sections are rewritten; the rest
+    of the file and all images are left as they are. The slug never changes,
+    even when the title does (use update_project to rename).
+
+    Args:
+        slug: Project slug
+        changes: dict with any of title, description, category, date, tools,
+            overview, takeaways, and visuals ({index: {'caption', 'role'}})
+        project_root: Path to project root
+
+    Returns:
+        dict with slug, markdown file path and list of fields that changed
+    """
+    project_root = Path(project_root)
+    markdown_file = project_root / '_projects' / f'{slug}.md'
+
+    if not markdown_file.exists():
+        raise ValueError(f"Project '{slug}' not found")
+
+    # Validate
+    changes = validate_patch_changes(changes)
+
+    original = markdown_file.read_text()
+    content = original
+    changed_fields = []
+
+    def apply(field, new_content):
+        nonlocal content
+        if new_content != content:
+            content = new_content
+            if field not in changed_fields:
+                changed_fields.append(field)
+
+    for key in PATCHABLE_FRONT_MATTER:
+        if key in changes:
+            apply(key, replace_front_matter_key(content, key, changes[key]))
+
+    if 'overview' in changes:
+        apply('overview', replace_section(content, PATCHABLE_SECTIONS['overview'], changes['overview']))
+
+    if 'takeaways' in changes:
+        apply('takeaways', replace_section(content, PATCHABLE_SECTIONS['takeaways'], generate_takeaways_section(changes['takeaways'])))
+
+    for index, visual in changes.get('visuals', {}).items():
+        apply('visuals', replace_visual(content, slug, index, visual.get('caption'), visual.get('role')))
+
+    # Skip the write entirely if nothing actually changed
+    if changed_fields:
+        markdown_file.write_text(content)
+
+    return {
+        'slug': slug,
+        'markdown_file': str(markdown_file),
+        'changed': bool(changed_fields),
+        'fields': changed_fields
+    }
+
+
+def git_push(project_root, message, paths=None):
     """Commit and push changes to GitHub.
     
     Args:
         project_root: Path to project root directory
         message: Commit message
+        paths: Optional list of paths to commit (default: all changes)
     
     Returns:
         dict with success status and message
     """
     try:
         project_root = Path(project_root)
+        paths = [str(p) for p in paths] if paths else []
         
-        # Add all changes
-        subprocess.run(['git', 'add', '-A'], cwd=project_root, check=True, capture_output=True)
+        # Add changes (only the given paths, if any)
+        subprocess.run(['git', 'add', '-A', '--', *paths], cwd=project_root, check=True, capture_output=True)
         
         # Commit
         result = subprocess.run(
-            ['git', 'commit', '-m', message], 
+            ['git', 'commit', '-m', message, '--', *paths] if paths else ['git', 'commit', '-m', message],
             cwd=project_root, 
             check=True, 
             capture_output=True,